@@ -1,96 +1,179 @@
 """Flask API for Options Pricing Application"""
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+from functools import lru_cache
 import sys
 import os
 
 # Add parent directory to path to import models
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from models import BlackScholesModel, BinomialTreeModel, MonteCarloModel
+from models import BlackScholesModel, BinomialTreeModel, MonteCarloModel, warm_jit_kernels
 from utils import OptionsVisualizer, OptionsAnalyzer
+try:
+    from api.schema import PricingParams
+except ImportError:
+    # Running app.py directly from the api directory
+    from schema import PricingParams
 import numpy as np
 
+# orjson is optional; fall back to Flask's jsonify if it is unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for Next.js frontend
 
+# Compile the Numba kernels (implied-vol Newton loop, binomial and Monte
+# Carlo sweeps) at import so the first request never pays JIT latency.
+# Under Gunicorn the master does this pre-fork via gunicorn.conf.py; this
+# covers the Flask dev server and direct script runs.
+warm_jit_kernels()
+
+
+def json_resp(obj, status=200):
+    """
+    Serialize a response body with orjson when available.
+
+    orjson is several times faster than stdlib json on the large base64
+    image strings and arrays the visualization endpoints return, and its
+    OPT_SERIALIZE_NUMPY flag handles numpy scalars and arrays directly.
+    """
+    if orjson is None:
+        response = jsonify(obj)
+        response.status_code = status
+        return response
+
+    return app.response_class(
+        orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+def _cache_key(value):
+    """Round a float input so near-identical slider values share a cache slot."""
+    return round(float(value), 6)
+
+
+@lru_cache(maxsize=4096)
+def _black_scholes_cached(S, K, T, r, sigma, option_type):
+    """Price + Greeks for one Black-Scholes parameter tuple, memoized."""
+    model = BlackScholesModel(S=S, K=K, T=T, r=r, sigma=sigma, option_type=option_type)
+    return {'price': model.price(), 'greeks': model.greeks()}
+
+
+@lru_cache(maxsize=4096)
+def _binomial_tree_cached(S, K, T, r, sigma, steps, option_type, exercise):
+    """Price and tree Greeks for one Binomial Tree parameter tuple, memoized."""
+    model = BinomialTreeModel(S=S, K=K, T=T, r=r, sigma=sigma, steps=steps,
+                              option_type=option_type, exercise=exercise)
+    return {'price': model.price(), 'delta': model.delta(), 'gamma': model.gamma()}
+
+
+@lru_cache(maxsize=4096)
+def _monte_carlo_cached(S, K, T, r, sigma, simulations, option_type, seed):
+    """Seeded Monte Carlo confidence-interval result, memoized."""
+    model = MonteCarloModel(S=S, K=K, T=T, r=r, sigma=sigma, simulations=simulations,
+                            option_type=option_type, seed=seed)
+    return model.price_with_confidence()
+
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({'status': 'healthy', 'message': 'Options Pricing API is running'})
+    return json_resp({'status': 'healthy', 'message': 'Options Pricing API is running'})
 
 
 @app.route('/api/price/black-scholes', methods=['POST'])
 def price_black_scholes():
     """Calculate option price using Black-Scholes model."""
     try:
-        data = request.json
-        model = BlackScholesModel(
-            S=float(data['spotPrice']),
-            K=float(data['strikePrice']),
-            T=float(data['timeToMaturity']),
-            r=float(data['riskFreeRate']),
-            sigma=float(data['volatility']),
-            option_type=data.get('optionType', 'call')
+        params = PricingParams.from_json(request.get_json(cache=True))
+        result = _black_scholes_cached(
+            S=_cache_key(params.S),
+            K=_cache_key(params.K),
+            T=_cache_key(params.T),
+            r=_cache_key(params.r),
+            sigma=_cache_key(params.sigma),
+            option_type=params.option_type
         )
 
-        result = {
-            'price': model.price(),
-            'greeks': model.greeks()
-        }
+        return json_resp(result)
+    except Exception as e:
+        return json_resp({'error': str(e)}, 400)
 
-        return jsonify(result)
+
+@app.route('/api/price/black-scholes/batch', methods=['POST'])
+def price_black_scholes_batch():
+    """Price a grid of Black-Scholes inputs in one vectorized call."""
+    try:
+        data = request.get_json(cache=True)
+
+        # Each field may be a scalar or a list; broadcast them together so
+        # the whole grid prices through a single vectorized evaluation
+        S, K, T, r, sigma = np.broadcast_arrays(*(
+            np.atleast_1d(np.asarray(data[key], dtype=float))
+            for key in ('spotPrice', 'strikePrice', 'timeToMaturity',
+                        'riskFreeRate', 'volatility')
+        ))
+        option_type = data.get('optionType', 'call')
+
+        prices = BlackScholesModel.price_vec(S, K, T, r, sigma, option_type)
+        greeks = BlackScholesModel.greeks_vec(S, K, T, r, sigma, option_type)
+
+        if orjson is None:
+            # jsonify cannot serialize ndarrays; mirror the payoff endpoint
+            prices = prices.tolist()
+            greeks = {name: values.tolist() for name, values in greeks.items()}
+
+        return json_resp({'prices': prices, 'greeks': greeks})
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return json_resp({'error': str(e)}, 400)
 
 
 @app.route('/api/price/binomial-tree', methods=['POST'])
 def price_binomial_tree():
     """Calculate option price using Binomial Tree model."""
     try:
-        data = request.json
-        model = BinomialTreeModel(
-            S=float(data['spotPrice']),
-            K=float(data['strikePrice']),
-            T=float(data['timeToMaturity']),
-            r=float(data['riskFreeRate']),
-            sigma=float(data['volatility']),
+        data = request.get_json(cache=True)
+        params = PricingParams.from_json(data)
+        result = _binomial_tree_cached(
+            S=_cache_key(params.S),
+            K=_cache_key(params.K),
+            T=_cache_key(params.T),
+            r=_cache_key(params.r),
+            sigma=_cache_key(params.sigma),
             steps=int(data.get('steps', 100)),
-            option_type=data.get('optionType', 'call'),
+            option_type=params.option_type,
             exercise=data.get('exercise', 'european')
         )
 
-        result = {
-            'price': model.price(),
-            'delta': model.delta(),
-            'gamma': model.gamma()
-        }
-
-        return jsonify(result)
+        return json_resp(result)
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return json_resp({'error': str(e)}, 400)
 
 
 @app.route('/api/price/monte-carlo', methods=['POST'])
 def price_monte_carlo():
     """Calculate option price using Monte Carlo simulation."""
     try:
-        data = request.json
-        model = MonteCarloModel(
-            S=float(data['spotPrice']),
-            K=float(data['strikePrice']),
-            T=float(data['timeToMaturity']),
-            r=float(data['riskFreeRate']),
-            sigma=float(data['volatility']),
+        data = request.get_json(cache=True)
+        params = PricingParams.from_json(data)
+        result = _monte_carlo_cached(
+            S=_cache_key(params.S),
+            K=_cache_key(params.K),
+            T=_cache_key(params.T),
+            r=_cache_key(params.r),
+            sigma=_cache_key(params.sigma),
             simulations=int(data.get('simulations', 10000)),
-            option_type=data.get('optionType', 'call'),
+            option_type=params.option_type,
             seed=42
         )
 
-        result = model.price_with_confidence()
-
-        return jsonify({
+        return json_resp({
             'price': result['price'],
             'standardError': result['std_error'],
             'confidenceInterval': {
@@ -99,26 +182,26 @@ def price_monte_carlo():
             }
         })
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return json_resp({'error': str(e)}, 400)
 
 
 @app.route('/api/compare', methods=['POST'])
 def compare_models():
     """Compare all pricing models."""
     try:
-        data = request.json
+        params = PricingParams.from_json(request.get_json(cache=True))
         results = OptionsAnalyzer.compare_models(
-            S=float(data['spotPrice']),
-            K=float(data['strikePrice']),
-            T=float(data['timeToMaturity']),
-            r=float(data['riskFreeRate']),
-            sigma=float(data['volatility']),
-            option_type=data.get('optionType', 'call')
+            S=params.S,
+            K=params.K,
+            T=params.T,
+            r=params.r,
+            sigma=params.sigma,
+            option_type=params.option_type
         )
 
-        return jsonify(results)
+        return json_resp(results)
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return json_resp({'error': str(e)}, 400)
 
 
 @app.route('/api/visualize/price-vs-spot', methods=['POST'])
@@ -134,7 +217,7 @@ def visualize_price_vs_spot():
 
         model_class = model_map.get(data['model'])
         if not model_class:
-            return jsonify({'error': 'Invalid model type'}), 400
+            return json_resp({'error': 'Invalid model type'}, 400)
 
         spot_min = float(data.get('spotMin', data['strikePrice'] * 0.5))
         spot_max = float(data.get('spotMax', data['strikePrice'] * 1.5))
@@ -157,9 +240,9 @@ def visualize_price_vs_spot():
             **kwargs
         )
 
-        return jsonify({'image': image_base64})
+        return json_resp({'image': image_base64})
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return json_resp({'error': str(e)}, 400)
 
 
 @app.route('/api/visualize/greeks', methods=['POST'])
@@ -181,23 +264,24 @@ def visualize_greeks():
             option_type=data.get('optionType', 'call')
         )
 
-        return jsonify({'image': image_base64})
+        return json_resp({'image': image_base64})
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return json_resp({'error': str(e)}, 400)
 
 
 @app.route('/api/visualize/monte-carlo-paths', methods=['POST'])
 def visualize_monte_carlo():
     """Generate Monte Carlo paths visualization."""
     try:
-        data = request.json
+        data = request.get_json(cache=True)
+        params = PricingParams.from_json(data)
         model = MonteCarloModel(
-            S=float(data['spotPrice']),
-            K=float(data['strikePrice']),
-            T=float(data['timeToMaturity']),
-            r=float(data['riskFreeRate']),
-            sigma=float(data['volatility']),
-            option_type=data.get('optionType', 'call'),
+            S=params.S,
+            K=params.K,
+            T=params.T,
+            r=params.r,
+            sigma=params.sigma,
+            option_type=params.option_type,
             seed=42
         )
 
@@ -208,9 +292,9 @@ def visualize_monte_carlo():
             option_type=data.get('optionType', 'call')
         )
 
-        return jsonify({'image': image_base64})
+        return json_resp({'image': image_base64})
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return json_resp({'error': str(e)}, 400)
 
 
 @app.route('/api/analyze/payoff', methods=['POST'])
@@ -229,34 +313,36 @@ def analyze_payoff():
             K=K,
             premium=float(data['premium']),
             option_type=data.get('optionType', 'call'),
-            position=data.get('position', 'long')
+            position=data.get('position', 'long'),
+            # orjson serializes float64 arrays directly; jsonify needs lists
+            as_list=orjson is None
         )
 
-        return jsonify(result)
+        return json_resp(result)
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return json_resp({'error': str(e)}, 400)
 
 
 @app.route('/api/analyze/sensitivity', methods=['POST'])
 def analyze_sensitivity():
     """Perform sensitivity analysis."""
     try:
-        data = request.json
-
+        data = request.get_json(cache=True)
+        params = PricingParams.from_json(data)
         result = OptionsAnalyzer.sensitivity_analysis(
-            S=float(data['spotPrice']),
-            K=float(data['strikePrice']),
-            T=float(data['timeToMaturity']),
-            r=float(data['riskFreeRate']),
-            sigma=float(data['volatility']),
-            option_type=data.get('optionType', 'call'),
+            S=params.S,
+            K=params.K,
+            T=params.T,
+            r=params.r,
+            sigma=params.sigma,
+            option_type=params.option_type,
             parameter=data['parameter'],
             variation_range=float(data.get('variationRange', 0.2))
         )
 
-        return jsonify(result)
+        return json_resp(result)
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return json_resp({'error': str(e)}, 400)
 
 
 @app.route('/api/implied-volatility', methods=['POST'])
@@ -275,11 +361,11 @@ def calculate_implied_volatility():
         )
 
         if iv is None:
-            return jsonify({'error': 'Implied volatility calculation did not converge'}), 400
+            return json_resp({'error': 'Implied volatility calculation did not converge'}, 400)
 
-        return jsonify({'impliedVolatility': iv})
+        return json_resp({'impliedVolatility': iv})
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return json_resp({'error': str(e)}, 400)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,39 @@
+"""Request schemas for the Options Pricing API."""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PricingParams:
+    """
+    Core pricing inputs shared by the model endpoints.
+
+    Parsed once per request so routes read typed attributes instead of
+    repeating dict lookups and float() casts on the raw JSON payload.
+    """
+
+    S: float
+    K: float
+    T: float
+    r: float
+    sigma: float
+    option_type: str = 'call'
+
+    @classmethod
+    def from_json(cls, data):
+        """
+        Build pricing parameters from a request payload.
+
+        Args:
+            data (dict): Parsed JSON request body
+
+        Returns:
+            PricingParams: Typed, immutable parameters
+        """
+        return cls(
+            S=float(data['spotPrice']),
+            K=float(data['strikePrice']),
+            T=float(data['timeToMaturity']),
+            r=float(data['riskFreeRate']),
+            sigma=float(data['volatility']),
+            option_type=str(data.get('optionType', 'call')).lower()
+        )
@@ -0,0 +1,30 @@
+"""Gunicorn configuration for the Options Pricing API.
+
+Run from the backend directory with:
+
+    gunicorn -c gunicorn.conf.py api.app:app
+"""
+import multiprocessing
+import os
+
+# Persist Numba's compiled artifacts next to the code so restarted
+# containers reuse them instead of recompiling. Must be set before
+# anything imports numba, which is why it lives at the top of this file.
+os.environ.setdefault(
+    'NUMBA_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.numba_cache')
+)
+
+bind = '0.0.0.0:5000'
+workers = multiprocessing.cpu_count()
+worker_class = 'sync'
+
+# Import the app (and therefore the Numba kernels) once in the master so
+# forked workers share the warm modules via copy-on-write
+preload_app = True
+
+
+def on_starting(server):
+    """Compile the JIT kernels in the master before any worker forks."""
+    from models import warm_jit_kernels
+    warm_jit_kernels()
@@ -3,4 +3,25 @@ from .black_scholes import BlackScholesModel
 from .binomial_tree import BinomialTreeModel
 from .monte_carlo import MonteCarloModel
 
-__all__ = ['BlackScholesModel', 'BinomialTreeModel', 'MonteCarloModel']
+__all__ = ['BlackScholesModel', 'BinomialTreeModel', 'MonteCarloModel', 'warm_jit_kernels']
+
+
+def warm_jit_kernels():
+    """
+    Force one-time compilation of the optional Numba kernels.
+
+    Called by the Gunicorn master before forking (see gunicorn.conf.py) so
+    workers inherit the compiled artifacts via copy-on-write instead of
+    paying the JIT cost on their first request. A no-op when Numba is not
+    installed.
+    """
+    try:
+        from . import _bt_numba  # noqa: F401 -- compiles via its import-time self-check
+        from ._bs_numba import bs_price, implied_vol
+        from ._mc_numba import mc_terminal_stats
+    except ImportError:
+        return
+
+    bs_price(100.0, 100.0, 1.0, 0.05, 0.2, True)
+    implied_vol(10.45, 100.0, 100.0, 1.0, 0.05, True)
+    mc_terminal_stats(100.0, 100.0, 1.0, 0.05, 0.2, 16, True)
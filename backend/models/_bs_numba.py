@@ -0,0 +1,118 @@
+"""Numba-compiled scalar kernels for the Black-Scholes model."""
+import math
+
+from numba import njit
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+
+
+@njit(cache=True, fastmath=True)
+def _phi(x):
+    """Standard normal CDF via math.erf."""
+    return 0.5 * (1.0 + math.erf(x * _INV_SQRT_2))
+
+
+@njit(cache=True, fastmath=True)
+def bs_price(S, K, T, r, sigma, is_call):
+    """
+    Scalar Black-Scholes price with all transcendentals inlined by LLVM.
+
+    Args:
+        S, K, T, r, sigma (float): Standard Black-Scholes inputs
+        is_call (bool): True for a call, False for a put
+
+    Returns:
+        float: Option price
+    """
+    sqrt_T = math.sqrt(T)
+    d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+
+    if is_call:
+        return S * _phi(d1) - K * math.exp(-r * T) * _phi(d2)
+    return K * math.exp(-r * T) * _phi(-d2) - S * _phi(-d1)
+
+
+@njit(cache=True, fastmath=True)
+def bs_vega(S, K, T, r, sigma):
+    """Scalar Black-Scholes vega (not rescaled by 100)."""
+    sqrt_T = math.sqrt(T)
+    d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * sqrt_T)
+    return S * math.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI * sqrt_T
+
+
+@njit(cache=True, fastmath=True)
+def implied_vol(target, S, K, T, r, is_call, x0=0.3, tol=1e-5, maxit=100):
+    """
+    Bracketed Halley implied volatility, fully compiled.
+
+    The price is monotone in sigma, so each evaluation narrows a
+    [lo, hi] bracket; a Halley step is accepted only when vega is usable
+    and the step stays inside the bracket, otherwise the iteration
+    bisects. Halley's method uses vomma (the second derivative in sigma,
+    vega * d1 * d2 / sigma, essentially free once d1/d2 and vega are
+    known) for cubic convergence, trimming a couple of iterations off
+    plain Newton. Starts from the Jackel inflection-point guess, which
+    puts the iteration inside its convergence region for any strike.
+
+    Args:
+        target (float): Observed market price of the option
+        S, K, T, r (float): Standard Black-Scholes inputs
+        is_call (bool): True for a call, False for a put
+        x0 (float): Fallback initial guess if the inflection guess degenerates
+        tol (float): Convergence tolerance on the price difference
+        maxit (int): Maximum number of iterations
+
+    Returns:
+        float: Implied volatility, or NaN if the solve did not converge
+    """
+    guess = math.sqrt(abs(2.0 * (math.log(K / S) + r * T) / T))
+    sigma = guess if guess > 1e-3 else x0
+
+    lo = 1e-6
+    hi = 5.0
+
+    sqrt_T = math.sqrt(T)
+    log_SK = math.log(S / K)
+    K_disc = K * math.exp(-r * T)
+
+    for _ in range(maxit):
+        sig_sqrt_T = sigma * sqrt_T
+        d1 = (log_SK + (r + 0.5 * sigma * sigma) * T) / sig_sqrt_T
+        d2 = d1 - sig_sqrt_T
+
+        if is_call:
+            price = S * _phi(d1) - K_disc * _phi(d2)
+        else:
+            price = K_disc * _phi(-d2) - S * _phi(-d1)
+
+        price_diff = target - price
+
+        if abs(price_diff) < tol:
+            return sigma
+
+        # Price increases with sigma, so the sign of the miss tells us
+        # which side of the root we are on
+        if price_diff > 0.0:
+            lo = sigma
+        else:
+            hi = sigma
+
+        vega = S * math.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI * sqrt_T
+        if vega > 1e-8:
+            # Halley update; falls back to the Newton step when the
+            # curvature correction degenerates
+            vomma = vega * d1 * d2 / sigma
+            denom = 2.0 * vega * vega + price_diff * vomma
+            if abs(denom) > 1e-12:
+                sigma = sigma + 2.0 * price_diff * vega / denom
+            else:
+                sigma = sigma + price_diff / vega
+        else:
+            sigma = lo - 1.0  # Force the bisection fallback below
+
+        if sigma <= lo or sigma >= hi:
+            sigma = 0.5 * (lo + hi)
+
+    return math.nan
@@ -0,0 +1,71 @@
+"""Numba-compiled kernels for the Binomial Tree model."""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def american_backward(S, K, u, d, p, disc, steps, is_call):
+    """
+    Full backward sweep for an American option, scalar node by scalar node.
+
+    Loop-style code lets Numba fuse the continuation/exercise comparison
+    into a single pass with no intermediate arrays.
+
+    Args:
+        S (float): Current stock price
+        K (float): Strike price
+        u (float): Up factor
+        d (float): Down factor
+        p (float): Risk-neutral probability
+        disc (float): Per-step discount factor
+        steps (int): Number of time steps in the tree
+        is_call (bool): True for a call, False for a put
+
+    Returns:
+        float: Option price at the root node
+    """
+    values = np.empty(steps + 1)
+
+    # Payoffs at maturity
+    for j in range(steps + 1):
+        stock_price = S * u ** (steps - j) * d ** j
+        payoff = stock_price - K if is_call else K - stock_price
+        values[j] = payoff if payoff > 0.0 else 0.0
+
+    # Backward induction with early-exercise check at every node
+    for i in range(steps - 1, -1, -1):
+        for j in range(i + 1):
+            continuation = disc * (p * values[j] + (1.0 - p) * values[j + 1])
+            stock_price = S * u ** (i - j) * d ** j
+            payoff = stock_price - K if is_call else K - stock_price
+            exercise = payoff if payoff > 0.0 else 0.0
+            values[j] = continuation if continuation > exercise else exercise
+
+    return values[0]
+
+
+def _self_check():
+    """
+    Verify the compiled kernel against a plain NumPy rollback.
+
+    fastmath allows reordering that could, in principle, change results;
+    a cheap check at import time guards against a silently wrong kernel.
+    """
+    S, K, u, d, p, disc, steps = 100.0, 100.0, 1.1, 1 / 1.1, 0.55, 0.99, 16
+
+    j = np.arange(steps + 1)
+    stock_prices = S * u ** (steps - j) * d ** j
+    values = np.maximum(K - stock_prices, 0)
+    for i in range(steps - 1, -1, -1):
+        stock_prices = stock_prices[:-1] / u
+        values = disc * (p * values[:-1] + (1 - p) * values[1:])
+        values = np.maximum(values, np.maximum(K - stock_prices, 0))
+
+    compiled = american_backward(S, K, u, d, p, disc, steps, False)
+    if abs(compiled - values[0]) > 1e-8 * max(1.0, abs(values[0])):
+        raise ImportError(
+            f"Numba binomial kernel self-check failed: {compiled} != {values[0]}"
+        )
+
+
+_self_check()
@@ -0,0 +1,44 @@
+"""Numba-compiled kernels for the Monte Carlo model."""
+import math
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def mc_terminal_stats(S, K, T, r, sigma, sims, is_call):
+    """
+    Raw terminal-payoff Monte Carlo, parallelized over simulations.
+
+    Each prange iteration draws its own Gaussian (Numba keeps RNG state
+    thread-local), computes the terminal price and payoff inline, and the
+    sum / sum-of-squares accumulate through parallel reductions. No
+    intermediate arrays are materialized.
+
+    Draws come from the per-thread RNG states, so results are not
+    reproducible across runs; callers that need a fixed seed use the
+    NumPy path instead.
+
+    Args:
+        S, K, T, r, sigma (float): Standard model inputs
+        sims (int): Number of simulations
+        is_call (bool): True for a call, False for a put
+
+    Returns:
+        tuple: (sum of payoffs, sum of squared payoffs)
+    """
+    drift = (r - 0.5 * sigma * sigma) * T
+    vol = sigma * math.sqrt(T)
+
+    total = 0.0
+    total_sq = 0.0
+    for i in prange(sims):
+        z = np.random.normal(0.0, 1.0)
+        terminal = S * math.exp(drift + vol * z)
+        payoff = terminal - K if is_call else K - terminal
+        if payoff < 0.0:
+            payoff = 0.0
+        total += payoff
+        total_sq += payoff * payoff
+
+    return total, total_sq
@@ -1,5 +1,15 @@
 """Binomial Tree Option Pricing Model"""
 import numpy as np
+from scipy.stats import binom
+
+# Numba is optional; fall back to the NumPy path if it is unavailable
+try:
+    from ._bt_numba import american_backward as _american_backward
+except ImportError:
+    try:
+        from _bt_numba import american_backward as _american_backward
+    except ImportError:
+        _american_backward = None
 
 
 class BinomialTreeModel:
@@ -40,25 +50,42 @@ class BinomialTreeModel:
         self.p = (np.exp(r * self.dt) - self.d) / (self.u - self.d)  # Risk-neutral probability
         self.discount = np.exp(-r * self.dt)  # Discount factor
 
+        # Since d = 1/u, every node price is S * u^k for some integer k in
+        # [-steps, steps]. Precompute the powers once in log space so tree
+        # construction is pure indexing instead of per-node pow() calls.
+        # The grid extends down to -2*steps so the unused lower-triangle
+        # indices stay in range; those entries are discarded by np.triu.
+        self._u_powers = np.exp(np.arange(-2 * steps, steps + 1) * np.log(self.u))
+
     def _build_stock_tree(self):
         """Build the stock price tree."""
-        stock_tree = np.zeros((self.steps + 1, self.steps + 1))
+        # Node (j, i) holds S * u^(i-2j); look the powers up in the
+        # precomputed grid rather than exponentiating per node.
+        i = np.arange(self.steps + 1)
+        j = i[:, np.newaxis]
 
-        for i in range(self.steps + 1):
-            for j in range(i + 1):
-                stock_tree[j, i] = self.S * (self.u ** (i - j)) * (self.d ** j)
+        stock_tree = self.S * self._u_powers[2 * self.steps + i - 2 * j]
 
-        return stock_tree
+        # Zero out the unused nodes below the diagonal (j > i) to keep the
+        # same layout as before. Column-major order makes each time step
+        # contiguous in memory, matching the column-at-a-time access
+        # pattern of backward induction in get_tree().
+        return np.asfortranarray(np.triu(stock_tree))
 
     def _calculate_option_value(self, stock_price):
-        """Calculate option value at a given stock price."""
+        """Calculate option value at a given stock price (scalar or array)."""
         if self.option_type == 'call':
-            return max(0, stock_price - self.K)
+            return np.maximum(stock_price - self.K, 0)
         elif self.option_type == 'put':
-            return max(0, self.K - stock_price)
+            return np.maximum(self.K - stock_price, 0)
         else:
             raise ValueError("option_type must be 'call' or 'put'")
 
+    def _terminal_stock_prices(self):
+        """Stock prices at maturity, ordered from the top node down."""
+        j = np.arange(self.steps + 1)
+        return self.S * self._u_powers[2 * self.steps + self.steps - 2 * j]
+
     def price(self):
         """
         Calculate the option price using the Binomial Tree method.
@@ -66,27 +93,26 @@ class BinomialTreeModel:
         Returns:
             float: Option price
         """
-        stock_tree = self._build_stock_tree()
-        option_tree = np.zeros_like(stock_tree)
-
-        # Calculate option values at maturity (final column)
-        for j in range(self.steps + 1):
-            option_tree[j, self.steps] = self._calculate_option_value(stock_tree[j, self.steps])
-
-        # Backward induction through the tree
-        for i in range(self.steps - 1, -1, -1):
-            for j in range(i + 1):
-                # Calculate option value from next period
-                option_tree[j, i] = self.discount * (
-                    self.p * option_tree[j, i + 1] + (1 - self.p) * option_tree[j + 1, i + 1]
-                )
-
-                # For American options, check early exercise
-                if self.exercise == 'american':
-                    exercise_value = self._calculate_option_value(stock_tree[j, i])
-                    option_tree[j, i] = max(option_tree[j, i], exercise_value)
-
-        return option_tree[0, 0]
+        # American pricing touches every node; hand it to the compiled
+        # kernel when Numba is available, otherwise run the same 1-D
+        # NumPy rollback the Greeks use
+        if self.exercise == 'american':
+            if _american_backward is not None:
+                return float(_american_backward(
+                    float(self.S), float(self.K), float(self.u), float(self.d),
+                    float(self.p), float(self.discount), self.steps,
+                    self.option_type == 'call'
+                ))
+            _, values = self._front_columns()[0]
+            return float(values[0])
+
+        # Without early exercise the tree collapses to a closed-form sum:
+        # the binomially weighted, discounted expectation of the terminal
+        # payoffs. O(N) instead of O(N^2) backward induction.
+        weights = binom.pmf(np.arange(self.steps + 1), self.steps, 1 - self.p)
+        payoffs = self._calculate_option_value(self._terminal_stock_prices())
+
+        return np.exp(-self.r * self.T) * (weights * payoffs).sum()
 
     def get_tree(self):
         """
@@ -96,25 +122,54 @@ class BinomialTreeModel:
             tuple: (stock_tree, option_tree)
         """
         stock_tree = self._build_stock_tree()
-        option_tree = np.zeros_like(stock_tree)
+        option_tree = np.zeros_like(stock_tree, order='F')
 
         # Calculate option values at maturity
-        for j in range(self.steps + 1):
-            option_tree[j, self.steps] = self._calculate_option_value(stock_tree[j, self.steps])
+        option_tree[:, self.steps] = self._calculate_option_value(stock_tree[:, self.steps])
 
-        # Backward induction
+        # Backward induction, one vectorized column at a time
         for i in range(self.steps - 1, -1, -1):
-            for j in range(i + 1):
-                option_tree[j, i] = self.discount * (
-                    self.p * option_tree[j, i + 1] + (1 - self.p) * option_tree[j + 1, i + 1]
+            option_tree[:i + 1, i] = self.discount * (
+                self.p * option_tree[:i + 1, i + 1] + (1 - self.p) * option_tree[1:i + 2, i + 1]
+            )
+
+            if self.exercise == 'american':
+                option_tree[:i + 1, i] = np.maximum(
+                    option_tree[:i + 1, i],
+                    self._calculate_option_value(stock_tree[:i + 1, i])
                 )
 
-                if self.exercise == 'american':
-                    exercise_value = self._calculate_option_value(stock_tree[j, i])
-                    option_tree[j, i] = max(option_tree[j, i], exercise_value)
-
         return stock_tree, option_tree
 
+    def _front_columns(self):
+        """
+        Run backward induction keeping only the early columns of the tree.
+
+        Returns:
+            dict: Maps step index i (0, 1, 2) to (stock_prices, option_values)
+                  1-D arrays for the nodes at that step
+        """
+        stock_prices = self._terminal_stock_prices()
+        values = self._calculate_option_value(stock_prices)
+
+        front = {}
+        if self.steps <= 2:
+            front[self.steps] = (stock_prices, values)
+
+        for i in range(self.steps - 1, -1, -1):
+            stock_prices = stock_prices[:-1] / self.u
+            values = self.discount * (
+                self.p * values[:-1] + (1 - self.p) * values[1:]
+            )
+
+            if self.exercise == 'american':
+                values = np.maximum(values, self._calculate_option_value(stock_prices))
+
+            if i <= 2:
+                front[i] = (stock_prices, values)
+
+        return front
+
     def delta(self):
         """
         Calculate Delta using the binomial tree.
@@ -122,10 +177,10 @@ class BinomialTreeModel:
         Returns:
             float: Delta value
         """
-        stock_tree, option_tree = self.get_tree()
+        stock_prices, option_values = self._front_columns()[1]
 
         # Delta at the root using the first two nodes
-        delta = (option_tree[0, 1] - option_tree[1, 1]) / (stock_tree[0, 1] - stock_tree[1, 1])
+        delta = (option_values[0] - option_values[1]) / (stock_prices[0] - stock_prices[1])
         return delta
 
     def gamma(self):
@@ -135,11 +190,11 @@ class BinomialTreeModel:
         Returns:
             float: Gamma value
         """
-        stock_tree, option_tree = self.get_tree()
+        stock_prices, option_values = self._front_columns()[2]
 
         # Gamma calculation using second derivatives
-        delta_up = (option_tree[0, 2] - option_tree[1, 2]) / (stock_tree[0, 2] - stock_tree[1, 2])
-        delta_down = (option_tree[1, 2] - option_tree[2, 2]) / (stock_tree[1, 2] - stock_tree[2, 2])
-        gamma = (delta_up - delta_down) / ((stock_tree[0, 2] - stock_tree[2, 2]) / 2)
+        delta_up = (option_values[0] - option_values[1]) / (stock_prices[0] - stock_prices[1])
+        delta_down = (option_values[1] - option_values[2]) / (stock_prices[1] - stock_prices[2])
+        gamma = (delta_up - delta_down) / ((stock_prices[0] - stock_prices[2]) / 2)
 
         return gamma
@@ -1,6 +1,16 @@
 """Black-Scholes Option Pricing Model"""
+from functools import cached_property
+from math import exp, log, pi, sqrt
+
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
+
+_INV_SQRT_2PI = 1.0 / sqrt(2.0 * pi)
+
+
+def _norm_pdf(x):
+    """Standard normal density, inlined to skip scipy.stats dispatch."""
+    return exp(-0.5 * x * x) * _INV_SQRT_2PI
 
 
 class BlackScholesModel:
@@ -8,6 +18,10 @@ class BlackScholesModel:
     Implementation of the Black-Scholes option pricing model.
 
     The Black-Scholes model is used to calculate the theoretical price of European options.
+
+    Model parameters are treated as immutable after construction: d1/d2 and
+    sqrt(T) are cached on the instance so greeks() computes them once instead
+    of once per Greek. To reprice with different inputs, build a new instance.
     """
 
     def __init__(self, S, K, T, r, sigma, option_type='call'):
@@ -29,11 +43,21 @@ class BlackScholesModel:
         self.sigma = sigma
         self.option_type = option_type.lower()
 
+    @cached_property
+    def _sqrt_T(self):
+        """sqrt(T), computed once per instance."""
+        return sqrt(self.T)
+
+    @cached_property
+    def _d1_d2(self):
+        """(d1, d2) parameters, computed once per instance."""
+        d1 = (log(self.S / self.K) + (self.r + 0.5 * self.sigma**2) * self.T) / (self.sigma * self._sqrt_T)
+        d2 = d1 - self.sigma * self._sqrt_T
+        return d1, d2
+
     def _calculate_d1_d2(self):
         """Calculate d1 and d2 parameters for Black-Scholes formula."""
-        d1 = (np.log(self.S / self.K) + (self.r + 0.5 * self.sigma**2) * self.T) / (self.sigma * np.sqrt(self.T))
-        d2 = d1 - self.sigma * np.sqrt(self.T)
-        return d1, d2
+        return self._d1_d2
 
     def price(self):
         """
@@ -45,9 +69,9 @@ class BlackScholesModel:
         d1, d2 = self._calculate_d1_d2()
 
         if self.option_type == 'call':
-            price = self.S * norm.cdf(d1) - self.K * np.exp(-self.r * self.T) * norm.cdf(d2)
+            price = self.S * ndtr(d1) - self.K * exp(-self.r * self.T) * ndtr(d2)
         elif self.option_type == 'put':
-            price = self.K * np.exp(-self.r * self.T) * norm.cdf(-d2) - self.S * norm.cdf(-d1)
+            price = self.K * exp(-self.r * self.T) * ndtr(-d2) - self.S * ndtr(-d1)
         else:
             raise ValueError("option_type must be 'call' or 'put'")
 
@@ -63,9 +87,9 @@ class BlackScholesModel:
         d1, _ = self._calculate_d1_d2()
 
         if self.option_type == 'call':
-            return norm.cdf(d1)
+            return ndtr(d1)
         else:
-            return norm.cdf(d1) - 1
+            return ndtr(d1) - 1
 
     def gamma(self):
         """
@@ -75,7 +99,7 @@ class BlackScholesModel:
             float: Gamma value
         """
         d1, _ = self._calculate_d1_d2()
-        return norm.pdf(d1) / (self.S * self.sigma * np.sqrt(self.T))
+        return _norm_pdf(d1) / (self.S * self.sigma * self._sqrt_T)
 
     def vega(self):
         """
@@ -85,7 +109,7 @@ class BlackScholesModel:
             float: Vega value (divided by 100 for percentage change)
         """
         d1, _ = self._calculate_d1_d2()
-        return self.S * norm.pdf(d1) * np.sqrt(self.T) / 100
+        return self.S * _norm_pdf(d1) * self._sqrt_T / 100
 
     def theta(self):
         """
@@ -97,11 +121,11 @@ class BlackScholesModel:
         d1, d2 = self._calculate_d1_d2()
 
         if self.option_type == 'call':
-            theta = (-self.S * norm.pdf(d1) * self.sigma / (2 * np.sqrt(self.T))
-                     - self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(d2))
+            theta = (-self.S * _norm_pdf(d1) * self.sigma / (2 * self._sqrt_T)
+                     - self.r * self.K * exp(-self.r * self.T) * ndtr(d2))
         else:
-            theta = (-self.S * norm.pdf(d1) * self.sigma / (2 * np.sqrt(self.T))
-                     + self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(-d2))
+            theta = (-self.S * _norm_pdf(d1) * self.sigma / (2 * self._sqrt_T)
+                     + self.r * self.K * exp(-self.r * self.T) * ndtr(-d2))
 
         return theta / 365  # Convert to daily theta
 
@@ -115,9 +139,82 @@ class BlackScholesModel:
         _, d2 = self._calculate_d1_d2()
 
         if self.option_type == 'call':
-            return self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(d2) / 100
+            return self.K * self.T * exp(-self.r * self.T) * ndtr(d2) / 100
         else:
-            return -self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(-d2) / 100
+            return -self.K * self.T * exp(-self.r * self.T) * ndtr(-d2) / 100
+
+    @classmethod
+    def price_vec(cls, S, K, T, r, sigma, option_type='call'):
+        """
+        Calculate Black-Scholes prices for array-valued inputs in one pass.
+
+        All parameters broadcast against each other, so a sweep over one
+        parameter needs a single vectorized ndtr call instead of one model
+        instance per grid point.
+
+        Args:
+            S, K, T, r, sigma (float or numpy.ndarray): Model inputs
+            option_type (str): 'call' or 'put'
+
+        Returns:
+            numpy.ndarray: Option prices
+        """
+        S, K, T, r, sigma = (np.asarray(x, dtype=float) for x in (S, K, T, r, sigma))
+
+        sqrt_T = np.sqrt(T)
+        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * sqrt_T)
+        d2 = d1 - sigma * sqrt_T
+        discount = np.exp(-r * T)
+
+        if option_type.lower() == 'call':
+            return S * ndtr(d1) - K * discount * ndtr(d2)
+        elif option_type.lower() == 'put':
+            return K * discount * ndtr(-d2) - S * ndtr(-d1)
+        else:
+            raise ValueError("option_type must be 'call' or 'put'")
+
+    @classmethod
+    def greeks_vec(cls, S, K, T, r, sigma, option_type='call'):
+        """
+        Calculate all Greeks for array-valued inputs in one pass.
+
+        Mirrors the scalar Greek methods (including the vega/rho /100 and
+        per-day theta scaling) using broadcasting, for batch endpoints and
+        plotting sweeps.
+
+        Args:
+            S, K, T, r, sigma (float or numpy.ndarray): Model inputs
+            option_type (str): 'call' or 'put'
+
+        Returns:
+            dict: Arrays for 'delta', 'gamma', 'vega', 'theta', 'rho'
+        """
+        S, K, T, r, sigma = (np.asarray(x, dtype=float) for x in (S, K, T, r, sigma))
+
+        sqrt_T = np.sqrt(T)
+        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * sqrt_T)
+        d2 = d1 - sigma * sqrt_T
+        pdf_d1 = np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+        discount = np.exp(-r * T)
+
+        if option_type.lower() == 'call':
+            delta = ndtr(d1)
+            theta = (-S * pdf_d1 * sigma / (2 * sqrt_T) - r * K * discount * ndtr(d2)) / 365
+            rho = K * T * discount * ndtr(d2) / 100
+        elif option_type.lower() == 'put':
+            delta = ndtr(d1) - 1
+            theta = (-S * pdf_d1 * sigma / (2 * sqrt_T) + r * K * discount * ndtr(-d2)) / 365
+            rho = -K * T * discount * ndtr(-d2) / 100
+        else:
+            raise ValueError("option_type must be 'call' or 'put'")
+
+        return {
+            'delta': delta,
+            'gamma': pdf_d1 / (S * sigma * sqrt_T),
+            'vega': S * pdf_d1 * sqrt_T / 100,
+            'theta': theta,
+            'rho': rho
+        }
 
     def greeks(self):
         """
@@ -1,5 +1,11 @@
 """Options Analysis Utilities"""
+import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import numpy as np
+from scipy.optimize import brentq
+from scipy.special import ndtr
 
 try:
     # Try relative import (when used as a package)
@@ -8,6 +14,68 @@ except (ImportError, ValueError):
     # Fall back to direct import (when backend is in sys.path)
     from models import BlackScholesModel, BinomialTreeModel, MonteCarloModel
 
+# Compiled IV kernels; optional, with pure-Python fallbacks below
+try:
+    from ..models._bs_numba import bs_price as _bs_price_jit, implied_vol as _implied_vol_jit
+except (ImportError, ValueError):
+    try:
+        from models._bs_numba import bs_price as _bs_price_jit, implied_vol as _implied_vol_jit
+    except ImportError:
+        _bs_price_jit = None
+        _implied_vol_jit = None
+
+
+# Maps the public sensitivity-analysis parameter names to model arguments
+_PARAM_MAP = {'spot': 'S', 'volatility': 'sigma', 'time': 'T', 'rate': 'r'}
+
+
+@lru_cache(maxsize=1024)
+def _compare_models_cached(S, K, T, r, sigma, option_type):
+    """
+    Memoized three-model comparison for one parameter tuple.
+
+    Dashboards re-request the same (S, K, T, r, sigma) repeatedly as UI
+    elements toggle, so repeat comparisons become dict lookups instead of
+    a fresh binomial tree and Monte Carlo run. Callers must treat the
+    returned dict as read-only; compare_models returns a shallow copy.
+
+    The three models are independent, so a cache miss evaluates them on
+    a small thread pool. The tree rollback and Monte Carlo draws spend
+    their time in NumPy, which releases the GIL, so threads overlap the
+    two heavy models instead of running them back to back.
+    """
+    def _black_scholes():
+        bs_model = BlackScholesModel(S, K, T, r, sigma, option_type)
+        return {
+            'price': bs_model.price(),
+            'greeks': bs_model.greeks()
+        }
+
+    def _binomial_tree():
+        bt_model = BinomialTreeModel(S, K, T, r, sigma, steps=100, option_type=option_type)
+        return {
+            'price': bt_model.price(),
+            'delta': bt_model.delta(),
+            'gamma': bt_model.gamma()
+        }
+
+    def _monte_carlo():
+        mc_model = MonteCarloModel(S, K, T, r, sigma, simulations=10000, option_type=option_type, seed=42)
+        mc_result = mc_model.price_with_confidence()
+        return {
+            'price': mc_result['price'],
+            'confidence_interval': [mc_result['lower_bound'], mc_result['upper_bound']],
+            'std_error': mc_result['std_error']
+        }
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            'black_scholes': executor.submit(_black_scholes),
+            'binomial_tree': executor.submit(_binomial_tree),
+            'monte_carlo': executor.submit(_monte_carlo)
+        }
+        return {name: future.result() for name, future in futures.items()}
+
 
 class OptionsAnalyzer:
     """Utility class for analyzing options pricing results."""
@@ -28,38 +96,52 @@ class OptionsAnalyzer:
         Returns:
             dict: Comparison results from all models
         """
-        results = {}
+        cached = _compare_models_cached(
+            float(S), float(K), float(T), float(r), float(sigma), option_type
+        )
+        # Shallow per-model copies so callers can add keys without
+        # corrupting the cached entry
+        return {name: dict(section) for name, section in cached.items()}
 
-        # Black-Scholes
-        bs_model = BlackScholesModel(S, K, T, r, sigma, option_type)
-        results['black_scholes'] = {
-            'price': bs_model.price(),
-            'greeks': bs_model.greeks()
-        }
+    @staticmethod
+    def _implied_volatility_bracketed(market_price, S, K, T, r, option_type='call'):
+        """
+        Solve for implied volatility with Brent's method on a fixed bracket.
 
-        # Binomial Tree
-        bt_model = BinomialTreeModel(S, K, T, r, sigma, steps=100, option_type=option_type)
-        results['binomial_tree'] = {
-            'price': bt_model.price(),
-            'delta': bt_model.delta(),
-            'gamma': bt_model.gamma()
-        }
+        Used when Newton-Raphson diverges (deep OTM options, bad vega);
+        Brent is guaranteed to converge whenever the market price lies
+        between the model prices at the bracket endpoints.
 
-        # Monte Carlo
-        mc_model = MonteCarloModel(S, K, T, r, sigma, simulations=10000, option_type=option_type, seed=42)
-        mc_result = mc_model.price_with_confidence()
-        results['monte_carlo'] = {
-            'price': mc_result['price'],
-            'confidence_interval': [mc_result['lower_bound'], mc_result['upper_bound']],
-            'std_error': mc_result['std_error']
-        }
+        Args:
+            market_price (float): Observed market price of the option
+            S (float): Current stock price
+            K (float): Strike price
+            T (float): Time to maturity
+            r (float): Risk-free rate
+            option_type (str): 'call' or 'put'
 
-        return results
+        Returns:
+            float: Implied volatility (or None if the price is unattainable)
+        """
+        if _bs_price_jit is not None:
+            is_call = option_type == 'call'
+
+            def objective(sigma):
+                return _bs_price_jit(S, K, T, r, sigma, is_call) - market_price
+        else:
+            def objective(sigma):
+                return BlackScholesModel(S, K, T, r, sigma, option_type).price() - market_price
+
+        lo, hi = 1e-4, 5.0
+        if objective(lo) * objective(hi) > 0:
+            return None  # No sign change: price outside the attainable range
+
+        return brentq(objective, lo, hi, xtol=1e-6, maxiter=50)
 
     @staticmethod
     def calculate_implied_volatility(market_price, S, K, T, r, option_type='call', max_iterations=100, tolerance=1e-5):
         """
-        Calculate implied volatility using Newton-Raphson method.
+        Calculate implied volatility using a bracketed Halley iteration.
 
         Args:
             market_price (float): Observed market price of the option
@@ -74,33 +156,195 @@ class OptionsAnalyzer:
         Returns:
             float: Implied volatility (or None if not converged)
         """
+        # The model constructors lowercase option_type; the inline solver
+        # paths compare it directly, so normalize here too
+        option_type = option_type.lower()
+
+        # In-the-money prices are mostly intrinsic value and nearly
+        # vol-insensitive, so the solver hits the price tolerance long
+        # before sigma converges. Put-call parity (C - P = S - K*e^-rT)
+        # gives the OTM counterpart's price, which carries the same
+        # implied volatility with a usable vega; solve that instead.
+        forward_diff = S - K * math.exp(-r * T)
+        if option_type == 'call' and forward_diff > 0:
+            otm_price = market_price - forward_diff
+            if otm_price > 0:
+                market_price, option_type = otm_price, 'put'
+        elif option_type == 'put' and forward_diff < 0:
+            otm_price = market_price + forward_diff
+            if otm_price > 0:
+                market_price, option_type = otm_price, 'call'
+
         # Initial guess for volatility
         sigma = 0.3
 
+        if _implied_vol_jit is not None:
+            iv = _implied_vol_jit(
+                float(market_price), float(S), float(K), float(T), float(r),
+                option_type == 'call', sigma, tolerance, max_iterations
+            )
+            if not np.isnan(iv):
+                return iv
+            return OptionsAnalyzer._implied_volatility_bracketed(
+                market_price, S, K, T, r, option_type
+            )
+
+        # Pure-Python fallback: hoist the sigma-independent terms out of
+        # the Newton loop so each iteration only recomputes the
+        # sigma-dependent quantities, with math.erf as the normal CDF
+        sqrt_T = math.sqrt(T)
+        log_SK = math.log(S / K)
+        rT = r * T
+        K_disc = K * math.exp(-rT)
+        inv_sqrt_2 = 1.0 / math.sqrt(2.0)
+        inv_sqrt_2pi = 1.0 / math.sqrt(2.0 * math.pi)
+        is_call = option_type == 'call'
+
+        # Jackel inflection-point guess lands inside Newton's convergence
+        # region for any strike; keep 0.3 if it degenerates
+        guess = math.sqrt(abs(2.0 * (math.log(K / S) + rT) / T))
+        if guess > 1e-3:
+            sigma = guess
+
+        sigma_lo = 1e-6
+        sigma_hi = 5.0
+
         for i in range(max_iterations):
-            model = BlackScholesModel(S, K, T, r, sigma, option_type)
-            price = model.price()
-            vega = model.vega() * 100  # Convert back to full vega
+            sig_sqrt_T = sigma * sqrt_T
+            d1 = (log_SK + rT + 0.5 * sigma * sigma * T) / sig_sqrt_T
+            d2 = d1 - sig_sqrt_T
+
+            phi_d1 = 0.5 * (1.0 + math.erf(d1 * inv_sqrt_2))
+            phi_d2 = 0.5 * (1.0 + math.erf(d2 * inv_sqrt_2))
+
+            if is_call:
+                price = S * phi_d1 - K_disc * phi_d2
+            else:
+                price = K_disc * (1.0 - phi_d2) - S * (1.0 - phi_d1)
+
+            vega = S * sqrt_T * math.exp(-0.5 * d1 * d1) * inv_sqrt_2pi
 
             price_diff = market_price - price
 
             if abs(price_diff) < tolerance:
                 return sigma
 
-            if vega == 0:
-                return None
+            # Price increases with sigma; narrow the bracket accordingly
+            if price_diff > 0:
+                sigma_lo = sigma
+            else:
+                sigma_hi = sigma
+
+            # Halley update (vomma = vega*d1*d2/sigma is free here),
+            # accepted only inside the bracket; bisect when vega is
+            # unusable or the step escapes
+            if vega > 1e-8:
+                vomma = vega * d1 * d2 / sigma
+                denom = 2.0 * vega * vega + price_diff * vomma
+                if abs(denom) > 1e-12:
+                    sigma = sigma + 2.0 * price_diff * vega / denom
+                else:
+                    sigma = sigma + price_diff / vega
+            else:
+                sigma = sigma_lo - 1.0
+
+            if sigma <= sigma_lo or sigma >= sigma_hi:
+                sigma = 0.5 * (sigma_lo + sigma_hi)
+
+        # Newton did not converge; fall back to the bracketed solver
+        return OptionsAnalyzer._implied_volatility_bracketed(
+            market_price, S, K, T, r, option_type
+        )
 
-            # Newton-Raphson update
-            sigma = sigma + price_diff / vega
+    @staticmethod
+    def implied_volatility_vec(market_prices, S, K, T, r, option_type='call',
+                               max_iterations=100, tolerance=1e-5):
+        """
+        Solve implied volatility for a whole chain of prices at once.
 
-            # Ensure sigma stays positive
-            if sigma <= 0:
-                sigma = 0.01
+        Runs the bracketed Newton iteration on every strike simultaneously:
+        each pass makes one vectorized price/vega evaluation over the
+        still-unconverged elements instead of a full Python-level solve per
+        strike. Elements bisect their own [1e-6, 5.0] bracket whenever a
+        Newton step escapes it or vega is unusable.
 
-        return None  # Did not converge
+        Args:
+            market_prices (array-like): Observed option prices
+            S (float or array-like): Current stock price(s)
+            K (float or array-like): Strike price(s)
+            T (float or array-like): Time(s) to maturity
+            r (float or array-like): Risk-free rate(s)
+            option_type (str): 'call' or 'put'
+            max_iterations (int): Maximum number of iterations
+            tolerance (float): Convergence tolerance on the price difference
+
+        Returns:
+            numpy.ndarray: Implied volatilities, NaN where the solve failed
+        """
+        market_prices = np.atleast_1d(np.asarray(market_prices, dtype=float))
+        S, K, T, r = (np.broadcast_to(np.asarray(x, dtype=float), market_prices.shape)
+                      for x in (S, K, T, r))
+        is_call = option_type.lower() == 'call'
+
+        sqrt_T = np.sqrt(T)
+        K_disc = K * np.exp(-r * T)
+        log_SK = np.log(S / K)
+
+        # Jackel inflection-point guess per element (0.3 where degenerate)
+        guess = np.sqrt(np.abs(2.0 * (np.log(K / S) + r * T) / T))
+        sigma = np.where(guess > 1e-3, guess, 0.3)
+
+        lo = np.full(sigma.shape, 1e-6)
+        hi = np.full(sigma.shape, 5.0)
+        result = np.full(sigma.shape, np.nan)
+        active = np.ones(sigma.shape, dtype=bool)
+
+        for _ in range(max_iterations):
+            idx = np.flatnonzero(active)
+            if idx.size == 0:
+                break
+
+            sig = sigma[idx]
+            sig_sqrt_T = sig * sqrt_T[idx]
+            d1 = (log_SK[idx] + r[idx] * T[idx] + 0.5 * sig * sig_sqrt_T) / sig_sqrt_T
+            d2 = d1 - sig_sqrt_T
+
+            if is_call:
+                price = S[idx] * ndtr(d1) - K_disc[idx] * ndtr(d2)
+            else:
+                price = K_disc[idx] * ndtr(-d2) - S[idx] * ndtr(-d1)
+
+            vega = S[idx] * sqrt_T[idx] * np.exp(-0.5 * d1 * d1) / np.sqrt(2.0 * np.pi)
+            price_diff = market_prices[idx] - price
+
+            converged = np.abs(price_diff) < tolerance
+            result[idx[converged]] = sig[converged]
+            active[idx[converged]] = False
+
+            still = idx[~converged]
+            if still.size == 0:
+                break
+            sig = sig[~converged]
+            price_diff = price_diff[~converged]
+            vega = vega[~converged]
+
+            # Narrow each element's bracket by the sign of its miss
+            over = price_diff > 0
+            lo[still[over]] = sig[over]
+            hi[still[~over]] = sig[~over]
+
+            # Newton step where vega is usable, bisection elsewhere or
+            # wherever the step leaves the bracket
+            usable = vega > 1e-8
+            step = np.where(usable, sig + price_diff / np.where(usable, vega, 1.0),
+                            lo[still] - 1.0)
+            escaped = (step <= lo[still]) | (step >= hi[still])
+            sigma[still] = np.where(escaped, 0.5 * (lo[still] + hi[still]), step)
+
+        return result
 
     @staticmethod
-    def payoff_diagram(S_range, K, premium, option_type='call', position='long'):
+    def payoff_diagram(S_range, K, premium, option_type='call', position='long', as_list=False):
         """
         Calculate payoff and profit/loss for an options position.
 
@@ -110,26 +354,31 @@ class OptionsAnalyzer:
             premium (float): Option premium paid/received
             option_type (str): 'call' or 'put'
             position (str): 'long' or 'short'
+            as_list (bool): Convert results to Python lists. The default
+                keeps float64 arrays, which orjson serializes directly
+                without boxing every element into a Python float first.
 
         Returns:
             dict: Contains 'spot_prices', 'payoff', 'profit_loss'
         """
-        if option_type == 'call':
-            payoff = np.maximum(S_range - K, 0)
-        else:
-            payoff = np.maximum(K - S_range, 0)
-
-        if position == 'long':
-            profit_loss = payoff - premium
-        else:  # short
-            payoff = -payoff
-            profit_loss = -payoff + premium
-
-        return {
-            'spot_prices': S_range.tolist(),
-            'payoff': payoff.tolist(),
-            'profit_loss': profit_loss.tolist()
+        # Fold the call/put and long/short branches into sign factors so
+        # the payoff is three ufunc passes with one in-place sign flip
+        # instead of branch-specific temporaries
+        sign_type = 1.0 if option_type == 'call' else -1.0
+        sign_pos = 1.0 if position == 'long' else -1.0
+
+        payoff = np.maximum(sign_type * (S_range - K), 0.0)
+        payoff *= sign_pos
+        profit_loss = payoff - sign_pos * premium
+
+        result = {
+            'spot_prices': S_range,
+            'payoff': payoff,
+            'profit_loss': profit_loss
         }
+        if as_list:
+            return {key: value.tolist() for key, value in result.items()}
+        return result
 
     @staticmethod
     def sensitivity_analysis(S, K, T, r, sigma, option_type='call', parameter='spot', variation_range=0.2):
@@ -150,12 +399,11 @@ class OptionsAnalyzer:
             dict: Parameter values and corresponding option prices
         """
         base_values = {'S': S, 'K': K, 'T': T, 'r': r, 'sigma': sigma}
-        param_map = {'spot': 'S', 'volatility': 'sigma', 'time': 'T', 'rate': 'r'}
 
-        if parameter not in param_map:
+        if parameter not in _PARAM_MAP:
             raise ValueError(f"Invalid parameter: {parameter}")
 
-        param_key = param_map[parameter]
+        param_key = _PARAM_MAP[parameter]
         base_value = base_values[param_key]
 
         # Create range of values
@@ -166,16 +414,15 @@ class OptionsAnalyzer:
             param_values = np.linspace(base_value * (1 - variation_range),
                                       base_value * (1 + variation_range), 50)
 
-        prices = []
-        for value in param_values:
-            params = base_values.copy()
-            params[param_key] = value
-            model = BlackScholesModel(params['S'], params['K'], params['T'],
-                                     params['r'], params['sigma'], option_type)
-            prices.append(model.price())
+        # Vary one parameter as an array and price the whole grid in a
+        # single vectorized Black-Scholes evaluation; the swept argument
+        # replaces its scalar in place of any per-point model construction
+        params = {**base_values, param_key: param_values}
+        prices = BlackScholesModel.price_vec(params['S'], params['K'], params['T'],
+                                             params['r'], params['sigma'], option_type)
 
         return {
             'parameter': parameter,
             'values': param_values.tolist(),
-            'prices': prices
+            'prices': prices.tolist()
         }
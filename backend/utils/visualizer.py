@@ -2,9 +2,41 @@
 import numpy as np
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 import io
 import base64
+import os
+import queue
+
+# Pillow is optional; fall back to matplotlib's PNG writer without it
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Pool of reusable Figures: figure creation costs ~100 ms of backend and
+# font setup, so plots check a Figure out, draw on it, and return it
+# cleared. A pool (rather than one shared figure behind a lock) lets
+# concurrent requests render in parallel, each on its own figure.
+_FIG_POOL = queue.Queue()
+
+
+def _acquire_figure():
+    """Take a Figure from the pool, creating a fresh one when empty."""
+    try:
+        return _FIG_POOL.get_nowait()
+    except queue.Empty:
+        fig = Figure(figsize=(10, 6))
+        FigureCanvasAgg(fig)  # Attaches itself as fig.canvas
+        return fig
+
+
+def _release_figure(fig):
+    """Clear a Figure and return it to the pool."""
+    fig.clear()
+    _FIG_POOL.put(fig)
 
 
 class OptionsVisualizer:
@@ -29,22 +61,33 @@ class OptionsVisualizer:
             str: Base64 encoded PNG image
         """
         spot_prices = np.linspace(spot_range[0], spot_range[1], 100)
-        option_prices = []
-
-        for S in spot_prices:
-            model = model_class(S, K, T, r, sigma, option_type=option_type, **kwargs)
-            option_prices.append(model.price())
-
-        plt.figure(figsize=(10, 6))
-        plt.plot(spot_prices, option_prices, linewidth=2)
-        plt.xlabel('Spot Price', fontsize=12)
-        plt.ylabel('Option Price', fontsize=12)
-        plt.title(f'{option_type.capitalize()} Option Price vs Spot Price', fontsize=14)
-        plt.grid(True, alpha=0.3)
-        plt.axvline(x=K, color='r', linestyle='--', label=f'Strike = {K}')
-        plt.legend()
 
-        return OptionsVisualizer._fig_to_base64()
+        if hasattr(model_class, 'price_vec') and not kwargs:
+            # Black-Scholes prices the whole sweep in one vectorized call
+            option_prices = model_class.price_vec(spot_prices, K, T, r, sigma, option_type)
+        else:
+            option_prices = []
+            for S in spot_prices:
+                model = model_class(S, K, T, r, sigma, option_type=option_type, **kwargs)
+                option_prices.append(model.price())
+
+        fig = _acquire_figure()
+        try:
+            fig.set_size_inches(10, 6)
+            ax = fig.add_subplot(111)
+
+            ax.plot(spot_prices, option_prices, linewidth=2)
+            ax.set_xlabel('Spot Price', fontsize=12)
+            ax.set_ylabel('Option Price', fontsize=12)
+            ax.set_title(f'{option_type.capitalize()} Option Price vs Spot Price', fontsize=14)
+            ax.grid(True, alpha=0.3)
+            ax.axvline(x=K, color='r', linestyle='--', label=f'Strike = {K}')
+            ax.legend()
+
+            fig.tight_layout()
+            return OptionsVisualizer._fig_to_base64(fig)
+        finally:
+            _release_figure(fig)
 
     @staticmethod
     def plot_greeks(model_class, K, T, r, sigma, spot_range, option_type='call', **kwargs):
@@ -64,57 +107,77 @@ class OptionsVisualizer:
             str: Base64 encoded PNG image
         """
         spot_prices = np.linspace(spot_range[0], spot_range[1], 100)
-        deltas, gammas, vegas, thetas = [], [], [], []
-
-        for S in spot_prices:
-            model = model_class(S, K, T, r, sigma, option_type=option_type, **kwargs)
-            deltas.append(model.delta())
-            if hasattr(model, 'gamma'):
-                gammas.append(model.gamma())
-            if hasattr(model, 'vega'):
-                vegas.append(model.vega())
-            if hasattr(model, 'theta'):
-                thetas.append(model.theta())
-
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-
-        # Delta
-        axes[0, 0].plot(spot_prices, deltas, linewidth=2, color='blue')
-        axes[0, 0].set_xlabel('Spot Price')
-        axes[0, 0].set_ylabel('Delta')
-        axes[0, 0].set_title('Delta vs Spot Price')
-        axes[0, 0].grid(True, alpha=0.3)
-        axes[0, 0].axvline(x=K, color='r', linestyle='--', alpha=0.5)
-
-        # Gamma
-        if gammas:
-            axes[0, 1].plot(spot_prices, gammas, linewidth=2, color='green')
-            axes[0, 1].set_xlabel('Spot Price')
-            axes[0, 1].set_ylabel('Gamma')
-            axes[0, 1].set_title('Gamma vs Spot Price')
-            axes[0, 1].grid(True, alpha=0.3)
-            axes[0, 1].axvline(x=K, color='r', linestyle='--', alpha=0.5)
-
-        # Vega
-        if vegas:
-            axes[1, 0].plot(spot_prices, vegas, linewidth=2, color='orange')
-            axes[1, 0].set_xlabel('Spot Price')
-            axes[1, 0].set_ylabel('Vega')
-            axes[1, 0].set_title('Vega vs Spot Price')
-            axes[1, 0].grid(True, alpha=0.3)
-            axes[1, 0].axvline(x=K, color='r', linestyle='--', alpha=0.5)
-
-        # Theta
-        if thetas:
-            axes[1, 1].plot(spot_prices, thetas, linewidth=2, color='red')
-            axes[1, 1].set_xlabel('Spot Price')
-            axes[1, 1].set_ylabel('Theta')
-            axes[1, 1].set_title('Theta vs Spot Price')
-            axes[1, 1].grid(True, alpha=0.3)
-            axes[1, 1].axvline(x=K, color='r', linestyle='--', alpha=0.5)
-
-        plt.tight_layout()
-        return OptionsVisualizer._fig_to_base64()
+
+        if hasattr(model_class, 'greeks_vec') and not kwargs:
+            # All Greeks for the whole sweep share one d1/d2/ndtr pass
+            greeks = model_class.greeks_vec(spot_prices, K, T, r, sigma, option_type)
+            deltas = greeks['delta'].tolist()
+            gammas = greeks['gamma'].tolist()
+            vegas = greeks['vega'].tolist()
+            thetas = greeks['theta'].tolist()
+        else:
+            deltas, gammas, vegas, thetas = [], [], [], []
+
+            # Capability checks are fixed by the class; probe once instead
+            # of once per spot
+            has_gamma = hasattr(model_class, 'gamma')
+            has_vega = hasattr(model_class, 'vega')
+            has_theta = hasattr(model_class, 'theta')
+
+            for S in spot_prices:
+                model = model_class(S, K, T, r, sigma, option_type=option_type, **kwargs)
+                deltas.append(model.delta())
+                if has_gamma:
+                    gammas.append(model.gamma())
+                if has_vega:
+                    vegas.append(model.vega())
+                if has_theta:
+                    thetas.append(model.theta())
+
+        fig = _acquire_figure()
+        try:
+            fig.set_size_inches(14, 10)
+            axes = fig.subplots(2, 2)
+
+            # Delta
+            axes[0, 0].plot(spot_prices, deltas, linewidth=2, color='blue')
+            axes[0, 0].set_xlabel('Spot Price')
+            axes[0, 0].set_ylabel('Delta')
+            axes[0, 0].set_title('Delta vs Spot Price')
+            axes[0, 0].grid(True, alpha=0.3)
+            axes[0, 0].axvline(x=K, color='r', linestyle='--', alpha=0.5)
+
+            # Gamma
+            if gammas:
+                axes[0, 1].plot(spot_prices, gammas, linewidth=2, color='green')
+                axes[0, 1].set_xlabel('Spot Price')
+                axes[0, 1].set_ylabel('Gamma')
+                axes[0, 1].set_title('Gamma vs Spot Price')
+                axes[0, 1].grid(True, alpha=0.3)
+                axes[0, 1].axvline(x=K, color='r', linestyle='--', alpha=0.5)
+
+            # Vega
+            if vegas:
+                axes[1, 0].plot(spot_prices, vegas, linewidth=2, color='orange')
+                axes[1, 0].set_xlabel('Spot Price')
+                axes[1, 0].set_ylabel('Vega')
+                axes[1, 0].set_title('Vega vs Spot Price')
+                axes[1, 0].grid(True, alpha=0.3)
+                axes[1, 0].axvline(x=K, color='r', linestyle='--', alpha=0.5)
+
+            # Theta
+            if thetas:
+                axes[1, 1].plot(spot_prices, thetas, linewidth=2, color='red')
+                axes[1, 1].set_xlabel('Spot Price')
+                axes[1, 1].set_ylabel('Theta')
+                axes[1, 1].set_title('Theta vs Spot Price')
+                axes[1, 1].grid(True, alpha=0.3)
+                axes[1, 1].axvline(x=K, color='r', linestyle='--', alpha=0.5)
+
+            fig.tight_layout()
+            return OptionsVisualizer._fig_to_base64(fig)
+        finally:
+            _release_figure(fig)
 
     @staticmethod
     def plot_monte_carlo_paths(paths, K, option_type='call'):
@@ -129,25 +192,36 @@ class OptionsVisualizer:
         Returns:
             str: Base64 encoded PNG image
         """
-        plt.figure(figsize=(12, 7))
-
-        # Plot paths
-        time_steps = np.arange(paths.shape[1])
-        for i in range(min(100, paths.shape[0])):  # Plot up to 100 paths
-            plt.plot(time_steps, paths[i], alpha=0.3, linewidth=0.5)
-
-        # Plot mean path
-        mean_path = np.mean(paths, axis=0)
-        plt.plot(time_steps, mean_path, 'b-', linewidth=2, label='Mean Path')
-
-        plt.axhline(y=K, color='r', linestyle='--', linewidth=2, label=f'Strike = {K}')
-        plt.xlabel('Time Steps', fontsize=12)
-        plt.ylabel('Stock Price', fontsize=12)
-        plt.title('Monte Carlo Simulated Price Paths', fontsize=14)
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-
-        return OptionsVisualizer._fig_to_base64()
+        fig = _acquire_figure()
+        try:
+            fig.set_size_inches(12, 7)
+            ax = fig.add_subplot(111)
+
+            # Plot up to 100 paths as one LineCollection: a single artist
+            # Agg draws in one pass, instead of one Line2D per path
+            time_steps = np.arange(paths.shape[1])
+            shown = paths[:100]
+            segments = np.stack(
+                [np.broadcast_to(time_steps, shown.shape), shown], axis=-1
+            )
+            ax.add_collection(LineCollection(segments, alpha=0.3, linewidths=0.5))
+            ax.autoscale()
+
+            # Plot mean path
+            mean_path = np.mean(paths, axis=0)
+            ax.plot(time_steps, mean_path, 'b-', linewidth=2, label='Mean Path')
+
+            ax.axhline(y=K, color='r', linestyle='--', linewidth=2, label=f'Strike = {K}')
+            ax.set_xlabel('Time Steps', fontsize=12)
+            ax.set_ylabel('Stock Price', fontsize=12)
+            ax.set_title('Monte Carlo Simulated Price Paths', fontsize=14)
+            ax.legend()
+            ax.grid(True, alpha=0.3)
+
+            fig.tight_layout()
+            return OptionsVisualizer._fig_to_base64(fig)
+        finally:
+            _release_figure(fig)
 
     @staticmethod
     def plot_volatility_surface(model_class, spot_price, strikes, maturities, r, sigma, option_type='call'):
@@ -166,34 +240,71 @@ class OptionsVisualizer:
         Returns:
             str: Base64 encoded PNG image
         """
-        from mpl_toolkits.mplot3d import Axes3D
-
         K_grid, T_grid = np.meshgrid(strikes, maturities)
-        prices = np.zeros_like(K_grid)
-
-        for i in range(len(maturities)):
-            for j in range(len(strikes)):
-                model = model_class(spot_price, K_grid[i, j], T_grid[i, j], r, sigma, option_type=option_type)
-                prices[i, j] = model.price()
 
-        fig = plt.figure(figsize=(12, 8))
-        ax = fig.add_subplot(111, projection='3d')
-        surf = ax.plot_surface(K_grid, T_grid, prices, cmap='viridis', alpha=0.8)
-
-        ax.set_xlabel('Strike Price', fontsize=11)
-        ax.set_ylabel('Time to Maturity', fontsize=11)
-        ax.set_zlabel('Option Price', fontsize=11)
-        ax.set_title(f'{option_type.capitalize()} Option Price Surface', fontsize=14)
-        fig.colorbar(surf, shrink=0.5, aspect=5)
-
-        return OptionsVisualizer._fig_to_base64()
+        if hasattr(model_class, 'price_vec'):
+            # The whole strike/maturity grid prices in one broadcast call
+            prices = model_class.price_vec(spot_price, K_grid, T_grid, r, sigma, option_type)
+        else:
+            prices = np.zeros_like(K_grid, dtype=float)
+            for i in range(len(maturities)):
+                for j in range(len(strikes)):
+                    model = model_class(spot_price, K_grid[i, j], T_grid[i, j], r, sigma, option_type=option_type)
+                    prices[i, j] = model.price()
+
+        fig = _acquire_figure()
+        try:
+            fig.set_size_inches(12, 8)
+            ax = fig.add_subplot(111, projection='3d')
+            surf = ax.plot_surface(K_grid, T_grid, prices, cmap='viridis', alpha=0.8)
+
+            ax.set_xlabel('Strike Price', fontsize=11)
+            ax.set_ylabel('Time to Maturity', fontsize=11)
+            ax.set_zlabel('Option Price', fontsize=11)
+            ax.set_title(f'{option_type.capitalize()} Option Price Surface', fontsize=14)
+            fig.colorbar(surf, shrink=0.5, aspect=5)
+
+            return OptionsVisualizer._fig_to_base64(fig)
+        finally:
+            _release_figure(fig)
 
     @staticmethod
-    def _fig_to_base64():
-        """Convert current matplotlib figure to base64 string."""
+    def _fig_to_base64(fig):
+        """
+        Render a figure to a base64 PNG string.
+
+        Encodes the Agg canvas's RGBA buffer directly through Pillow at a
+        low compression level: savefig with bbox_inches='tight' renders
+        the figure twice (once to measure the tight bounding box), and
+        libpng's default level 6 dominates the remaining cost. The plot
+        methods call tight_layout() instead, so the single render is
+        already cropped sensibly.
+        """
         buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-        plt.close()
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-        return img_base64
+
+        if Image is None:
+            fig.savefig(buf, format='png', dpi=100)
+        else:
+            canvas = fig.canvas
+            canvas.draw()
+            img = Image.frombuffer('RGBA', canvas.get_width_height(),
+                                   canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1)
+            img.save(buf, 'PNG', compress_level=1)
+
+        return base64.b64encode(buf.getvalue()).decode('utf-8')
+
+# Matplotlib builds its font cache and resolves text layout lazily, which
+# can put 300+ ms on whichever request draws the first chart. Render a
+# throwaway plot at import so that cost lands on process startup instead;
+# the warmed figure seeds the pool. Disable via OPTIPRICE_WARM_MPL=0.
+if os.environ.get('OPTIPRICE_WARM_MPL', '1') == '1':
+    _warm_fig = _acquire_figure()
+    try:
+        _warm_ax = _warm_fig.add_subplot(111)
+        _warm_ax.plot([0, 1], [0, 1])
+        _warm_ax.set_title('warmup')
+        _warm_fig.canvas.draw()
+        del _warm_ax
+    finally:
+        _release_figure(_warm_fig)
+        del _warm_fig